@@ -0,0 +1,80 @@
+"""Request dependencies shared by the API routers."""
+
+import email.message
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any
+
+from fastapi import Depends, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from pydantic.json_schema import models_json_schema
+
+from src.models.dto import ProjectPayloadDTO, ScheduleValidationRequestDTO
+
+
+def _is_json_content_type(content_type: str | None) -> bool:
+    """Return whether ``content_type`` is ``application/json`` or ``application/*+json``."""
+    if not content_type:
+        return False
+    message = email.message.Message()
+    message["content-type"] = content_type
+    subtype = message.get_content_subtype()
+    return message.get_content_maintype() == "application" and (subtype == "json" or subtype.endswith("+json"))
+
+
+def json_body[ModelT: BaseModel](model: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """Create a dependency that validates the raw request body as ``model``.
+
+    FastAPI decodes JSON bodies with the standard library and then validates
+    the resulting dict. ``model_validate_json`` parses and validates in one
+    pydantic-core pass instead. Validation errors are re-raised as
+    ``RequestValidationError`` so clients still receive FastAPI's 422 format.
+
+    As with FastAPI's ``strict_content_type``, bodies without a JSON
+    content type are rejected, so cross-origin ``text/plain`` posts (which
+    skip the CORS preflight) cannot trigger the endpoint.
+    """
+
+    async def parse_body(request: Request) -> ModelT:
+        body = await request.body()
+        try:
+            if not _is_json_content_type(request.headers.get("content-type")):
+                # FastAPI validates non-JSON bodies as raw bytes, which always fails with its usual 422 error
+                return model.model_validate(body, from_attributes=True)
+            return model.model_validate_json(body)
+        except ValidationError as exc:
+            errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+            raise RequestValidationError(errors, body=body) from exc
+
+    return parse_body
+
+
+OPENAPI_REF_TEMPLATE = "#/components/schemas/{model}"
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """Return ``openapi_extra`` documenting a body parsed by :func:`json_body`.
+
+    The body schema is referenced from ``components/schemas``; the application
+    adds it there with :func:`json_body_components`.
+    """
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": {"$ref": OPENAPI_REF_TEMPLATE.format(model=model.__name__)}}},
+            "required": True,
+        }
+    }
+
+
+def json_body_components(*models: type[BaseModel]) -> dict[str, Any]:
+    """Return OpenAPI component schemas for ``models`` and every model they reference."""
+    _, schema = models_json_schema([(model, "validation") for model in models], ref_template=OPENAPI_REF_TEMPLATE)
+    definitions: dict[str, Any] = schema.get("$defs", {})
+    return definitions
+
+
+# Bodies documented with json_body_openapi; their schemas are added to the OpenAPI components
+JSON_BODY_MODELS: tuple[type[BaseModel], ...] = (ProjectPayloadDTO, ScheduleValidationRequestDTO)
+
+ProjectPayload = Annotated[ProjectPayloadDTO, Depends(json_body(ProjectPayloadDTO))]
+ScheduleValidationRequest = Annotated[ScheduleValidationRequestDTO, Depends(json_body(ScheduleValidationRequestDTO))]
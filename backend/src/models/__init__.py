@@ -6,10 +6,14 @@ from src.models.dto import (
     FlowDefinitionDTO,
     GraphEdgeDTO,
     GraphNodeDTO,
+    InputNodeDTO,
+    IntermediateNodeDTO,
     MeasBasisDTO,
+    OutputNodeDTO,
     PlannerMeasBasisDTO,
     ProjectPayloadDTO,
     ScheduleResultDTO,
+    ScheduleValidationRequestDTO,
     TimeSliceDTO,
     ValidationErrorDTO,
     ValidationResponseDTO,
@@ -22,10 +26,14 @@ __all__ = [
     "FlowDefinitionDTO",
     "GraphEdgeDTO",
     "GraphNodeDTO",
+    "InputNodeDTO",
+    "IntermediateNodeDTO",
     "MeasBasisDTO",
+    "OutputNodeDTO",
     "PlannerMeasBasisDTO",
     "ProjectPayloadDTO",
     "ScheduleResultDTO",
+    "ScheduleValidationRequestDTO",
     "TimeSliceDTO",
     "ValidationErrorDTO",
     "ValidationResponseDTO",
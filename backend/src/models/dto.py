@@ -5,7 +5,7 @@ with strict validation (extra="forbid") to prevent schema drift.
 """
 
 from collections.abc import Mapping, Sequence, Set
-from typing import Literal, Self
+from typing import Annotated, Literal, Self
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -17,8 +17,7 @@ def normalize_edge_id(source: str, target: str) -> str:
 
     This must match the frontend's normalizeEdgeId function exactly.
     """
-    a, b = sorted([source, target])
-    return f"{a}-{b}"
+    return f"{source}-{target}" if source < target else f"{target}-{source}"
 
 
 # === Coordinate DTOs ===
@@ -57,7 +56,8 @@ class AxisMeasBasisDTO(BaseModel):
     sign: Literal["PLUS", "MINUS"]
 
 
-MeasBasisDTO = PlannerMeasBasisDTO | AxisMeasBasisDTO
+# Tagged on "type" so pydantic selects the variant directly instead of trying each one
+MeasBasisDTO = Annotated[PlannerMeasBasisDTO | AxisMeasBasisDTO, Field(discriminator="type")]
 type AxisName = Literal["X", "Y", "Z"]
 type PlaneName = Literal["XY", "YZ", "XZ"]
 type DetectorMismatchReason = Literal[
@@ -71,52 +71,55 @@ type DetectorMismatchReason = Literal[
 # === Node DTOs ===
 
 
-class GraphNodeDTO(BaseModel):
-    """Graph node with role-based validation.
-
-    - input: requires measBasis and qubitIndex
-    - output: may have measBasis when the output is measured, requires qubitIndex
-    - intermediate: requires measBasis, must NOT have qubitIndex
-    - inputBasis: optional for inputs (defaults to X semantics), forbidden otherwise
-    """
+class _GraphNodeBaseDTO(BaseModel):
+    """Fields shared by every graph node role."""
 
     model_config = ConfigDict(extra="forbid")
 
     id: str
     coordinate: CoordinateDTO
-    role: Literal["input", "output", "intermediate"]
-    measBasis: MeasBasisDTO | None = None
-    qubitIndex: int | None = None
+
+
+class InputNodeDTO(_GraphNodeBaseDTO):
+    """Input node: requires measBasis and qubitIndex, optional inputBasis (defaults to X semantics)."""
+
+    role: Literal["input"]
+    measBasis: MeasBasisDTO
+    qubitIndex: int
     inputBasis: Literal["X", "Y", "Z"] | None = None
 
-    @model_validator(mode="after")
-    def validate_role_requirements(self) -> Self:
-        """Validate that fields match role requirements."""
-        if self.role == "input":
-            if self.measBasis is None:
-                raise ValueError("input node requires measBasis")
-            if self.qubitIndex is None:
-                raise ValueError("input node requires qubitIndex")
-        elif self.role == "output":
-            if self.qubitIndex is None:
-                raise ValueError("output node requires qubitIndex")
-            if self.inputBasis is not None:
-                raise ValueError("output node must not have inputBasis")
-        elif self.role == "intermediate":
-            if self.measBasis is None:
-                raise ValueError("intermediate node requires measBasis")
-            if self.qubitIndex is not None:
-                raise ValueError("intermediate node must not have qubitIndex")
-            if self.inputBasis is not None:
-                raise ValueError("intermediate node must not have inputBasis")
-        return self
+
+class OutputNodeDTO(_GraphNodeBaseDTO):
+    """Output node: may have measBasis when the output is measured, requires qubitIndex."""
+
+    role: Literal["output"]
+    measBasis: MeasBasisDTO | None = None
+    qubitIndex: int
+    inputBasis: None = None
+
+
+class IntermediateNodeDTO(_GraphNodeBaseDTO):
+    """Intermediate node: requires measBasis, must NOT have qubitIndex or inputBasis."""
+
+    role: Literal["intermediate"]
+    measBasis: MeasBasisDTO
+    qubitIndex: None = None
+    inputBasis: None = None
+
+
+# Tagged on "role" so the role requirements are enforced by each variant's schema
+GraphNodeDTO = Annotated[InputNodeDTO | OutputNodeDTO | IntermediateNodeDTO, Field(discriminator="role")]
 
 
 # === Edge DTOs ===
 
 
 class GraphEdgeDTO(BaseModel):
-    """Graph edge with normalized ID validation."""
+    """Graph edge.
+
+    The normalized ID is checked by ProjectPayloadDTO alongside the other
+    per-edge checks, avoiding a separate validator call for every edge.
+    """
 
     model_config = ConfigDict(extra="forbid")
 
@@ -124,14 +127,6 @@ class GraphEdgeDTO(BaseModel):
     source: str
     target: str
 
-    @model_validator(mode="after")
-    def validate_edge_id(self) -> Self:
-        """Validate that edge ID is properly normalized."""
-        expected_id = normalize_edge_id(self.source, self.target)
-        if self.id != expected_id:
-            raise ValueError(f"Edge id must be normalized: expected '{expected_id}', got '{self.id}'")
-        return self
-
 
 # === Flow DTOs ===
 
@@ -221,6 +216,9 @@ class ProjectPayloadDTO(BaseModel):
             raise ValueError("node IDs must be unique")
 
         for edge in self.edges:
+            expected_id = normalize_edge_id(edge.source, edge.target)
+            if edge.id != expected_id:
+                raise ValueError(f"Edge id must be normalized: expected '{expected_id}', got '{edge.id}'")
             if edge.source == edge.target:
                 raise ValueError(f"self-edge is not allowed: {edge.id}")
             if edge.source not in node_id_set:
@@ -290,3 +288,17 @@ class ScheduleResultDTO(BaseModel):
     measureTime: dict[str, int | None]
     entangleTime: dict[str, int | None]
     timeline: list[TimeSliceDTO]
+
+
+# === Request Envelope DTOs ===
+
+
+class ScheduleValidationRequestDTO(BaseModel):
+    """Request body for /api/validate-schedule.
+
+    Unknown top-level keys are ignored, as they were when FastAPI embedded
+    ``project`` and ``schedule`` as separate body parameters.
+    """
+
+    project: ProjectPayloadDTO
+    schedule: ScheduleResultDTO
@@ -0,0 +1,30 @@
+"""Response classes shared by the API routers."""
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+from src.models.dto import ValidationResponseDTO
+
+
+class PydanticJSONResponse(Response):
+    """JSON response rendered directly by pydantic-core.
+
+    Routes return this instead of a model so FastAPI skips its response
+    validation and encoding pass. Keep ``response_model`` on the route so the
+    OpenAPI schema still documents the payload.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes:
+        """Serialize models, dicts, and lists to JSON bytes in a single Rust pass.
+
+        Bytes are treated as an already serialized body and sent unchanged.
+        """
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+# Successful validation is the common case, so its body is serialized once at import.
+VALID_RESPONSE_JSON = to_json(ValidationResponseDTO(valid=True, errors=[]))
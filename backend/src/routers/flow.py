@@ -5,37 +5,51 @@ POST /api/compute-zflow - Auto-compute z-flow from x-flow.
 
 from fastapi import APIRouter
 
+from src.dependencies import ProjectPayload, json_body_openapi
 from src.models.dto import ProjectPayloadDTO
-from src.services.converter import compute_zflow_from_xflow, dto_to_graphstate, zflow_to_dto
+from src.responses import PydanticJSONResponse
+from src.services.cache import LRUCache, content_digest
+from src.services.converter import compute_zflow_from_xflow, dto_to_flow, dto_to_graphstate, zflow_to_dto
 
 router = APIRouter(prefix="/api", tags=["flow"])
 
+# Z-flow depends only on the project content, so repeat submissions are served from memory.
+ZFLOW_CACHE = LRUCache[bytes, dict[str, list[str]]](maxsize=128)
 
-@router.post("/compute-zflow")
-def compute_zflow(project: ProjectPayloadDTO) -> dict[str, list[str]]:
+
+@router.post(
+    "/compute-zflow",
+    response_model=dict[str, list[str]],
+    openapi_extra=json_body_openapi(ProjectPayloadDTO),
+)
+def compute_zflow(project: ProjectPayload) -> PydanticJSONResponse:
     """Compute z-flow from x-flow using odd_neighbors.
 
     When zflow is set to "auto" in the frontend, this endpoint
     computes the actual z-flow corrections based on the x-flow
-    and graph structure using the odd_neighbors algorithm.
+    and graph structure using the odd_neighbors algorithm. Results
+    are cached by project content in ZFLOW_CACHE.
 
     Args:
         project: The project payload containing the graph and x-flow.
 
     Returns:
-        A dictionary mapping node IDs to lists of z-flow correction targets.
+        A JSON object mapping node IDs to lists of z-flow correction targets.
     """
+    cache_key = content_digest(project)
+    if (cached := ZFLOW_CACHE.get(cache_key)) is not None:
+        return PydanticJSONResponse(cached)
+
     # Convert DTO to graphqomb objects
-    graph, node_map = dto_to_graphstate(project)
-    reverse_map = {v: k for k, v in node_map.items()}
+    graph, node_map, reverse_map = dto_to_graphstate(project)
 
-    # Convert x-flow to internal format
-    xflow: dict[int, set[int]] = {}
-    for node_id, targets in project.flow.xflow.items():
-        xflow[node_map[node_id]] = {node_map[t] for t in targets}
+    # Convert x-flow to internal format (a manual z-flow is ignored here)
+    xflow, _ = dto_to_flow(project, node_map)
 
     # Compute z-flow using odd_neighbors
     zflow = compute_zflow_from_xflow(graph, xflow)
 
     # Convert back to frontend format
-    return zflow_to_dto(zflow, reverse_map)
+    result = zflow_to_dto(zflow, reverse_map)
+    ZFLOW_CACHE.put(cache_key, result)
+    return PydanticJSONResponse(result)
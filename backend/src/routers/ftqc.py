@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException
 from graphqomb.common import Axis, Plane, determine_pauli_axis
 from graphqomb.pauli_frame import PauliFrame
 
+from src.dependencies import ProjectPayload, json_body_openapi
 from src.models.dto import (
     AxisName,
     CompiledFTQCResponseDTO,
@@ -17,6 +18,7 @@ from src.models.dto import (
     PlaneName,
     ProjectPayloadDTO,
 )
+from src.responses import PydanticJSONResponse
 from src.services.converter import compute_zflow_from_xflow, dto_to_flow, dto_to_graphstate
 
 router = APIRouter(prefix="/api", tags=["ftqc"])
@@ -25,22 +27,26 @@ AXIS_NAMES: dict[Axis, AxisName] = {Axis.X: "X", Axis.Y: "Y", Axis.Z: "Z"}
 PLANE_NAMES: dict[Plane, PlaneName] = {Plane.XY: "XY", Plane.YZ: "YZ", Plane.XZ: "XZ"}
 
 
-@router.post("/compile-ftqc", response_model=CompiledFTQCResponseDTO)
-def compile_ftqc(project: ProjectPayloadDTO) -> CompiledFTQCResponseDTO:
+@router.post(
+    "/compile-ftqc",
+    response_model=CompiledFTQCResponseDTO,
+    openapi_extra=json_body_openapi(ProjectPayloadDTO),
+)
+def compile_ftqc(project: ProjectPayload) -> PydanticJSONResponse:
     """Compile FTQC groups and diagnose detector determinism with GraphQOMB."""
     if project.ftqc is None:
-        return CompiledFTQCResponseDTO(
-            parityCheckGroup=[],
-            parityCheckTags=[],
-            logicalObservableGroup={},
-            detectorDiagnostics=[],
+        return PydanticJSONResponse(
+            CompiledFTQCResponseDTO.model_construct(
+                parityCheckGroup=[],
+                parityCheckTags=[],
+                logicalObservableGroup={},
+                detectorDiagnostics=[],
+            )
         )
 
-    graph, node_map = dto_to_graphstate(project)
-    reverse_map = {node: node_id for node_id, node in node_map.items()}
-    xflow, zflow = dto_to_flow(project, node_map)
-    if zflow is None:
-        zflow = compute_zflow_from_xflow(graph, xflow)
+    graph, node_map, reverse_map = dto_to_graphstate(project)
+    xflow, manual_zflow = dto_to_flow(project, node_map)
+    zflow = compute_zflow_from_xflow(graph, xflow) if manual_zflow is None else manual_zflow
 
     try:
         parity_check_group = [{node_map[node_id] for node_id in group} for group in project.ftqc.parityCheckGroup]
@@ -67,11 +73,13 @@ def compile_ftqc(project: ProjectPayloadDTO) -> CompiledFTQCResponseDTO:
     except (KeyError, ValueError) as exc:
         raise HTTPException(status_code=400, detail=f"Unable to compile FTQC groups: {exc}") from exc
 
-    return CompiledFTQCResponseDTO(
-        parityCheckGroup=compiled_detectors,
-        parityCheckTags=parity_check_tags,
-        logicalObservableGroup=compiled_observables,
-        detectorDiagnostics=detector_diagnostics,
+    return PydanticJSONResponse(
+        CompiledFTQCResponseDTO.model_construct(
+            parityCheckGroup=compiled_detectors,
+            parityCheckTags=parity_check_tags,
+            logicalObservableGroup=compiled_observables,
+            detectorDiagnostics=detector_diagnostics,
+        )
     )
 
 
@@ -112,7 +120,7 @@ def _detector_diagnostics(
                 continue
 
             mismatches.append(
-                DetectorMismatchDTO(
+                DetectorMismatchDTO.model_construct(
                     nodeId=reverse_map[node],
                     stabilizerAxis=AXIS_NAMES[stabilizer_axis] if stabilizer_axis is not None else None,
                     detectorMeasurementAxis=AXIS_NAMES[measurement_axis] if measurement_axis is not None else None,
@@ -125,6 +133,6 @@ def _detector_diagnostics(
                 )
             )
 
-        diagnostics.append(DetectorDiagnosticDTO(deterministic=deterministic, mismatches=mismatches))
+        diagnostics.append(DetectorDiagnosticDTO.model_construct(deterministic=deterministic, mismatches=mismatches))
 
     return diagnostics
@@ -5,9 +5,9 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict
 
+from src.responses import PydanticJSONResponse
 from src.services.import_sessions import create_import_session, read_import_session
 from src.services.ptn_import import ptn_text_to_project
 
@@ -31,7 +31,7 @@ def create_import_session_endpoint(project: dict[str, Any]) -> dict[str, str]:
 
 
 @router.get("/import-session/{token}")
-def get_import_session(token: str) -> JSONResponse:
+def get_import_session(token: str) -> PydanticJSONResponse:
     """Return a temporary project imported by the CLI."""
     try:
         project: dict[str, Any] = read_import_session(token)
@@ -39,14 +39,14 @@ def get_import_session(token: str) -> JSONResponse:
         raise HTTPException(status_code=404, detail="Import session not found") from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return JSONResponse(project)
+    return PydanticJSONResponse(project)
 
 
 @router.post("/import-ptn")
-def import_ptn(request: PtnImportRequest) -> JSONResponse:
+def import_ptn(request: PtnImportRequest) -> PydanticJSONResponse:
     """Convert PTN text into a Studio project."""
     try:
         project = ptn_text_to_project(request.text, name=request.name)
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=400, detail=f"Invalid PTN file: {exc}") from exc
-    return JSONResponse(project)
+    return PydanticJSONResponse(project)
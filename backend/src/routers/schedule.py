@@ -4,21 +4,27 @@ POST /api/schedule - Compute measurement schedule.
 POST /api/validate-schedule - Validate a manually edited schedule.
 """
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Literal
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from graphqomb.schedule_solver import ScheduleConfig, Strategy
 from graphqomb.scheduler import Scheduler
 
+from src.dependencies import ProjectPayload, ScheduleValidationRequest, json_body_openapi
 from src.models.dto import (
     ProjectPayloadDTO,
     ScheduleResultDTO,
+    ScheduleValidationRequestDTO,
     ValidationErrorDTO,
     ValidationResponseDTO,
 )
+from src.responses import VALID_RESPONSE_JSON, PydanticJSONResponse
+from src.services.cache import LRUCache, cached_graph_context, content_digest
 from src.services.converter import (
-    dto_to_flow,
-    dto_to_graphstate,
     dto_to_schedule,
     schedule_to_dto,
     translate_error_message,
@@ -26,10 +32,27 @@ from src.services.converter import (
 
 router = APIRouter(prefix="/api", tags=["scheduling"])
 
+# CP-SAT releases the GIL while searching, so a small dedicated pool bounds
+# concurrent solves without competing with the sync endpoints for workers.
+SOLVER_MAX_WORKERS = 4
+SOLVER_EXECUTOR = ThreadPoolExecutor(max_workers=SOLVER_MAX_WORKERS, thread_name_prefix="schedule-solver")
 
-@router.post("/schedule", response_model=ScheduleResultDTO)
-def compute_schedule(
-    project: ProjectPayloadDTO,
+# Seconds CP-SAT may search before returning its best (possibly suboptimal) schedule
+SOLVER_TIMEOUT = 60
+
+# Final schedules are served from memory on repeat submissions. A CP-SAT solve that hits
+# SOLVER_TIMEOUT may be suboptimal and differ between runs, so it is never cached.
+type ScheduleCacheKey = tuple[bytes, str, bool, int | None, int | None]
+SCHEDULE_CACHE = LRUCache[ScheduleCacheKey, ScheduleResultDTO](maxsize=128)
+
+
+@router.post(
+    "/schedule",
+    response_model=ScheduleResultDTO,
+    openapi_extra=json_body_openapi(ProjectPayloadDTO),
+)
+async def compute_schedule(
+    project: ProjectPayload,
     strategy: Literal["MINIMIZE_SPACE", "MINIMIZE_TIME"] = Query(
         default="MINIMIZE_SPACE",
         description="Schedule optimization strategy",
@@ -46,11 +69,17 @@ def compute_schedule(
         int | None,
         Query(ge=1, description="Maximum allowed number of active qubits"),
     ] = None,
-) -> ScheduleResultDTO:
+) -> PydanticJSONResponse:
     """Compute measurement schedule for the graph.
 
     Uses graphqomb's Scheduler to compute an optimal schedule
-    for preparing, entangling, and measuring qubits.
+    for preparing, entangling, and measuring qubits. The solver runs on
+    SOLVER_EXECUTOR so long searches neither block the event loop nor
+    occupy the threadpool shared by the sync endpoints. Final results
+    (greedy schedules and CP-SAT solves that finish before SOLVER_TIMEOUT)
+    are cached by project content and options in SCHEDULE_CACHE; the
+    project is hashed on the shared threadpool, since serializing a large
+    project would otherwise stall the event loop.
 
     Args:
         project: The project payload to schedule.
@@ -60,22 +89,16 @@ def compute_schedule(
         max_qubit_count: Optional maximum allowed number of active qubits.
 
     Returns:
-        ScheduleResultDTO with timing information for each operation.
+        JSON-encoded ScheduleResultDTO with timing information for each operation.
 
     Raises:
         HTTPException: If schedule computation fails.
     """
-    # Convert DTO to graphqomb objects
-    graph, node_map = dto_to_graphstate(project)
-    xflow, zflow = dto_to_flow(project, node_map)
-
-    # Create reverse map for converting back to frontend IDs
-    reverse_map = {v: k for k, v in node_map.items()}
+    digest = await run_in_threadpool(content_digest, project)
+    cache_key: ScheduleCacheKey = (digest, strategy, use_greedy, max_time, max_qubit_count)
+    if (cached := SCHEDULE_CACHE.get(cache_key)) is not None:
+        return PydanticJSONResponse(cached)
 
-    # Create scheduler
-    scheduler = Scheduler(graph, xflow, zflow)
-
-    # Configure and solve
     config = ScheduleConfig(
         strategy=Strategy[strategy],
         max_time=max_time,
@@ -83,35 +106,66 @@ def compute_schedule(
         use_greedy=use_greedy,
     )
 
+    loop = asyncio.get_running_loop()
+    result, final = await loop.run_in_executor(SOLVER_EXECUTOR, _solve_schedule, project, digest, config)
+    if final:
+        SCHEDULE_CACHE.put(cache_key, result)
+    return PydanticJSONResponse(result)
+
+
+def _solve_schedule(
+    project: ProjectPayloadDTO, digest: bytes, config: ScheduleConfig
+) -> tuple[ScheduleResultDTO, bool]:
+    """Build a scheduler for the project and solve it with the given config.
+
+    Returns:
+        The schedule DTO, and whether it is final: greedy schedules always
+        are, CP-SAT schedules only when the search ended before SOLVER_TIMEOUT
+        (graphqomb also accepts the best feasible schedule found by then).
+
+    Raises:
+        HTTPException: If schedule computation fails.
+    """
+    # Convert DTO to graphqomb objects (shared with /validate-schedule through the cache)
+    context = cached_graph_context(project, digest)
+
+    # Create scheduler (mutable, so never shared between requests)
+    scheduler = Scheduler(context.graph, context.xflow, context.zflow)
+
+    started = time.monotonic()
     try:
-        success = scheduler.solve_schedule(config, timeout=60)
+        success = scheduler.solve_schedule(config, timeout=SOLVER_TIMEOUT)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Schedule computation failed: {e}") from e
+    final = config.use_greedy or time.monotonic() - started < SOLVER_TIMEOUT
 
     if not success:
         raise HTTPException(status_code=400, detail="Schedule computation failed: no solution found")
 
-    if use_greedy and max_time is not None and scheduler.num_slices() - 1 > max_time:
+    max_time = config.max_time
+    if config.use_greedy and max_time is not None and scheduler.num_slices() - 1 > max_time:
         raise HTTPException(
             status_code=400,
             detail=f"Schedule computation failed: greedy schedule exceeds max_time={max_time}",
         )
 
     # Convert result to DTO
-    return schedule_to_dto(
+    result = schedule_to_dto(
         prepare_time=scheduler.prepare_time,
         measure_time=scheduler.measure_time,
         entangle_time=scheduler.entangle_time,
         timeline=scheduler.timeline,
-        reverse_map=reverse_map,
+        reverse_map=context.reverse_map,
     )
+    return result, final
 
 
-@router.post("/validate-schedule", response_model=ValidationResponseDTO)
-def validate_schedule(
-    project: ProjectPayloadDTO,
-    schedule: ScheduleResultDTO,
-) -> ValidationResponseDTO:
+@router.post(
+    "/validate-schedule",
+    response_model=ValidationResponseDTO,
+    openapi_extra=json_body_openapi(ScheduleValidationRequestDTO),
+)
+def validate_schedule(request: ScheduleValidationRequest) -> PydanticJSONResponse:
     """Validate a manually edited schedule.
 
     Uses graphqomb's Scheduler.validate_schedule() to check:
@@ -122,29 +176,26 @@ def validate_schedule(
     - Entanglement times respect causality constraints
 
     Args:
-        project: The project payload with graph and flow.
-        schedule: The schedule to validate.
+        request: The project payload with graph and flow, and the schedule to validate.
 
     Returns:
-        ValidationResponseDTO with valid=True if schedule is valid,
+        JSON-encoded ValidationResponseDTO with valid=True if schedule is valid,
         or valid=False with detailed error messages if invalid.
     """
+    project, schedule = request.project, request.schedule
     errors: list[ValidationErrorDTO] = []
     reverse_map: dict[int, str] = {}
 
     try:
-        # Convert DTO to graphqomb objects
-        graph, node_map = dto_to_graphstate(project)
-        xflow, zflow = dto_to_flow(project, node_map)
-
-        # Create reverse map for error message translation
-        reverse_map = {v: k for k, v in node_map.items()}
+        # Convert DTO to graphqomb objects (shared with /schedule through the cache)
+        context = cached_graph_context(project)
+        reverse_map = context.reverse_map
 
         # Create scheduler
-        scheduler = Scheduler(graph, xflow, zflow)
+        scheduler = Scheduler(context.graph, context.xflow, context.zflow)
 
         # Convert schedule DTO to graphqomb format
-        prepare_time, measure_time, entangle_time = dto_to_schedule(schedule, node_map)
+        prepare_time, measure_time, entangle_time = dto_to_schedule(schedule, context.node_map, context.edge_index)
 
         # Set manual schedule
         scheduler.manual_schedule(prepare_time, measure_time, entangle_time)
@@ -155,8 +206,10 @@ def validate_schedule(
     except ValueError as e:
         # Translate node indices in error message to frontend node IDs
         translated_message = translate_error_message(str(e), reverse_map)
-        errors.append(ValidationErrorDTO(type="schedule_validation", message=translated_message))
+        errors.append(ValidationErrorDTO.model_construct(type="schedule_validation", message=translated_message))
     except Exception as e:
-        errors.append(ValidationErrorDTO(type="error", message=str(e)))
+        errors.append(ValidationErrorDTO.model_construct(type="error", message=str(e)))
 
-    return ValidationResponseDTO(valid=len(errors) == 0, errors=errors)
+    if not errors:
+        return PydanticJSONResponse(VALID_RESPONSE_JSON)
+    return PydanticJSONResponse(ValidationResponseDTO.model_construct(valid=False, errors=errors))
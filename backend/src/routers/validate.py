@@ -6,14 +6,20 @@ POST /api/validate - Validate graph and flow.
 from fastapi import APIRouter
 from graphqomb.feedforward import check_flow
 
+from src.dependencies import ProjectPayload, json_body_openapi
 from src.models.dto import ProjectPayloadDTO, ValidationErrorDTO, ValidationResponseDTO
-from src.services.converter import dto_to_flow, dto_to_graphstate
+from src.responses import VALID_RESPONSE_JSON, PydanticJSONResponse
+from src.services.cache import cached_graph_context
 
 router = APIRouter(prefix="/api", tags=["validation"])
 
 
-@router.post("/validate", response_model=ValidationResponseDTO)
-def validate_project(project: ProjectPayloadDTO) -> ValidationResponseDTO:
+@router.post(
+    "/validate",
+    response_model=ValidationResponseDTO,
+    openapi_extra=json_body_openapi(ProjectPayloadDTO),
+)
+def validate_project(project: ProjectPayload) -> PydanticJSONResponse:
     """Validate graph structure and flow.
 
     Uses graphqomb's GraphState.check_canonical_form() and check_flow()
@@ -23,25 +29,26 @@ def validate_project(project: ProjectPayloadDTO) -> ValidationResponseDTO:
         project: The project payload to validate.
 
     Returns:
-        ValidationResponseDTO with valid=True if all checks pass,
+        JSON-encoded ValidationResponseDTO with valid=True if all checks pass,
         or valid=False with error details if validation fails.
     """
     errors: list[ValidationErrorDTO] = []
 
     try:
-        # Convert DTO to graphqomb objects
-        graph, node_map = dto_to_graphstate(project)
-        xflow, zflow = dto_to_flow(project, node_map)
+        # Convert DTO to graphqomb objects (reused across endpoints through the cache)
+        context = cached_graph_context(project)
 
         # Check canonical form against graphqomb's graph/input/output conventions.
-        graph.check_canonical_form()
+        context.graph.check_canonical_form()
 
         # Check flow validity
-        check_flow(graph, xflow, zflow)
+        check_flow(context.graph, context.xflow, context.zflow)
 
     except ValueError as e:
-        errors.append(ValidationErrorDTO(type="validation", message=str(e)))
+        errors.append(ValidationErrorDTO.model_construct(type="validation", message=str(e)))
     except Exception as e:
-        errors.append(ValidationErrorDTO(type="error", message=str(e)))
+        errors.append(ValidationErrorDTO.model_construct(type="error", message=str(e)))
 
-    return ValidationResponseDTO(valid=len(errors) == 0, errors=errors)
+    if not errors:
+        return PydanticJSONResponse(VALID_RESPONSE_JSON)
+    return PydanticJSONResponse(ValidationResponseDTO.model_construct(valid=False, errors=errors))
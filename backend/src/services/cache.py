@@ -0,0 +1,91 @@
+"""In-memory caches for deterministic API results."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from src.services.converter import GraphContext, dto_to_graph_context
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pydantic import BaseModel
+
+    from src.models.dto import ProjectPayloadDTO
+
+
+def content_digest(model: BaseModel) -> bytes:
+    """Return a stable digest of a model's JSON serialization for use in cache keys."""
+    return hashlib.blake2b(model.model_dump_json().encode(), digest_size=16).digest()
+
+
+class LRUCache[K: Hashable, V]:
+    """Thread-safe least-recently-used cache with a fixed number of entries.
+
+    When ``ttl`` is given, entries older than ``ttl`` seconds are treated as missing.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Interactive editing alternates /api/schedule and /api/validate-schedule on the same
+# project, so both reuse the converted graph and flows for a few minutes.
+GRAPH_CONTEXT_CACHE = LRUCache[bytes, GraphContext](maxsize=64, ttl=300)
+
+
+def cached_graph_context(project: ProjectPayloadDTO, digest: bytes | None = None) -> GraphContext:
+    """Return the graphqomb objects for a project, converting it only on a cache miss.
+
+    The returned objects are shared between requests and must not be mutated.
+
+    Args:
+        project: The project payload DTO.
+        digest: The project's content_digest, if the caller already computed it.
+
+    Returns:
+        The cached or freshly converted GraphContext.
+    """
+    key = content_digest(project) if digest is None else digest
+    context = GRAPH_CONTEXT_CACHE.get(key)
+    if context is None:
+        context = dto_to_graph_context(project)
+        GRAPH_CONTEXT_CACHE.put(key, context)
+    return context
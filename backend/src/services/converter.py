@@ -5,11 +5,15 @@ library objects (DRY principle - no reimplementation of graphqomb logic).
 """
 
 import math
-from collections.abc import Sequence
-from typing import Any
+import re
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from functools import partial
+from typing import NamedTuple
 
 from graphqomb.common import Axis, AxisMeasBasis, Plane, PlannerMeasBasis, Sign
-from graphqomb.graphstate import GraphState
+from graphqomb.graphstate import GraphState, odd_neighbors
+from graphqomb.scheduler import TimeSlice
 
 from src.models.dto import (
     AxisMeasBasisDTO,
@@ -20,50 +24,102 @@ from src.models.dto import (
     normalize_edge_id,
 )
 
+# Precomputed lookups for the per-node measurement basis conversion
+_TWO_PI = 2 * math.pi
+_PLANES: dict[str, Plane] = {"XY": Plane.XY, "YZ": Plane.YZ, "XZ": Plane.XZ}
+_AXES: dict[str, Axis] = {"X": Axis.X, "Y": Axis.Y, "Z": Axis.Z}
+_SIGNS: dict[str, Sign] = {"PLUS": Sign.PLUS, "MINUS": Sign.MINUS}
+
+# Node index patterns in graphqomb error messages ("[0, 2, 5]", "node 3", "Edge (0, 1)"), matched in one pass
+_DIGIT_PATTERN = re.compile(r"\d")
+_NODE_INDEX_PATTERN = re.compile(
+    r"\[(?P<indices>\d+(?:,\s*\d+)*)\]"
+    r"|\bnode (?P<node>\d+)"
+    r"|\b(?P<prefix>Edge|edge) \((?P<u>\d+), (?P<v>\d+)\)"
+)
+
 
-def dto_to_graphstate(project: ProjectPayloadDTO) -> tuple[GraphState, dict[str, int]]:
+def dto_to_graphstate(project: ProjectPayloadDTO) -> tuple[GraphState, dict[str, int], dict[int, str]]:
     """Convert ProjectPayloadDTO to graphqomb GraphState.
 
     Args:
         project: The project payload DTO from the frontend.
 
     Returns:
-        A tuple of (GraphState, node_map) where node_map maps
-        frontend node IDs (str) to graphqomb node indices (int).
+        A tuple of (GraphState, node_map, reverse_map) where node_map maps
+        frontend node IDs (str) to graphqomb node indices (int) and
+        reverse_map is its inverse.
     """
     graph = GraphState()
     node_map: dict[str, int] = {}
+    reverse_map: dict[int, str] = {}
+    add_node = graph.add_node
+    assign_meas_basis = graph.assign_meas_basis
 
-    # Add nodes
+    # Add nodes, register inputs/outputs, and assign measurement bases in a single pass
     for node_dto in project.nodes:
         coord = node_dto.coordinate
-        coord_tuple = (coord.x, coord.y, coord.z)
-        node_id = graph.add_node(coordinate=coord_tuple)
+        node_id = add_node(coordinate=(coord.x, coord.y, coord.z))
         node_map[node_dto.id] = node_id
+        reverse_map[node_id] = node_dto.id
 
-    # Add edges
-    for edge_dto in project.edges:
-        source_id = node_map[edge_dto.source]
-        target_id = node_map[edge_dto.target]
-        graph.add_edge(source_id, target_id)
-
-    # Register inputs and outputs
-    for node_dto in project.nodes:
-        node_id = node_map[node_dto.id]
-        if node_dto.role == "input" and node_dto.qubitIndex is not None:
-            init_axis = Axis.X if node_dto.inputBasis is None else Axis[node_dto.inputBasis]
+        if node_dto.role == "input":
+            init_axis = Axis.X if node_dto.inputBasis is None else _AXES[node_dto.inputBasis]
             graph.register_input(node_id, node_dto.qubitIndex, init_axis=init_axis)
-        elif node_dto.role == "output" and node_dto.qubitIndex is not None:
+        elif node_dto.role == "output":
             graph.register_output(node_id, node_dto.qubitIndex)
 
-    # Assign measurement bases
-    for node_dto in project.nodes:
         if node_dto.measBasis is not None:
-            node_id = node_map[node_dto.id]
-            meas_basis = dto_to_meas_basis(node_dto.measBasis)
-            graph.assign_meas_basis(node_id, meas_basis)
+            assign_meas_basis(node_id, dto_to_meas_basis(node_dto.measBasis))
+
+    # Add edges (requires the complete node map)
+    add_edge = graph.add_edge
+    for edge_dto in project.edges:
+        add_edge(node_map[edge_dto.source], node_map[edge_dto.target])
+
+    return graph, node_map, reverse_map
+
+
+class GraphContext(NamedTuple):
+    """graphqomb objects converted from a single project payload."""
+
+    graph: GraphState
+    node_map: dict[str, int]
+    reverse_map: dict[int, str]
+    xflow: dict[int, frozenset[int]]
+    zflow: dict[int, frozenset[int]] | None
+    edge_index: dict[str, tuple[int, int]]
+
+
+def dto_to_graph_context(project: ProjectPayloadDTO) -> GraphContext:
+    """Convert a project to its GraphState, node mappings, and flows.
+
+    Args:
+        project: The project payload DTO from the frontend.
+
+    Returns:
+        A GraphContext with zflow set to None when the project uses "auto".
+    """
+    graph, node_map, reverse_map = dto_to_graphstate(project)
+    xflow, zflow = dto_to_flow(project, node_map)
+    return GraphContext(graph, node_map, reverse_map, xflow, zflow, build_edge_index(project, node_map))
+
+
+def build_edge_index(project: ProjectPayloadDTO, node_map: dict[str, int]) -> dict[str, tuple[int, int]]:
+    """Map each normalized edge ID to its graphqomb edge in canonical order (smaller index first).
+
+    Args:
+        project: The project payload DTO (edge IDs are already validated as normalized).
+        node_map: Mapping from frontend node IDs to graphqomb indices.
 
-    return graph, node_map
+    Returns:
+        A dict from edge ID to the (u, v) index pair with u < v.
+    """
+    edge_index: dict[str, tuple[int, int]] = {}
+    for edge_dto in project.edges:
+        u, v = node_map[edge_dto.source], node_map[edge_dto.target]
+        edge_index[edge_dto.id] = (u, v) if u < v else (v, u)
+    return edge_index
 
 
 def dto_to_meas_basis(dto: PlannerMeasBasisDTO | AxisMeasBasisDTO) -> PlannerMeasBasis | AxisMeasBasis:
@@ -75,20 +131,15 @@ def dto_to_meas_basis(dto: PlannerMeasBasisDTO | AxisMeasBasisDTO) -> PlannerMea
     Returns:
         A graphqomb PlannerMeasBasis or AxisMeasBasis object.
     """
-    if isinstance(dto, PlannerMeasBasisDTO):
-        plane = Plane[dto.plane]
-        angle = 2 * math.pi * dto.angleCoeff
-        return PlannerMeasBasis(plane, angle)
-    else:
-        axis = Axis[dto.axis]
-        sign = Sign[dto.sign]
-        return AxisMeasBasis(axis, sign)
+    if dto.type == "planner":
+        return PlannerMeasBasis(_PLANES[dto.plane], _TWO_PI * dto.angleCoeff)
+    return AxisMeasBasis(_AXES[dto.axis], _SIGNS[dto.sign])
 
 
 def dto_to_flow(
     project: ProjectPayloadDTO,
     node_map: dict[str, int],
-) -> tuple[dict[int, set[int]], dict[int, set[int]] | None]:
+) -> tuple[dict[int, frozenset[int]], dict[int, frozenset[int]] | None]:
     """Convert FlowDefinitionDTO to graphqomb flow format.
 
     Args:
@@ -97,21 +148,24 @@ def dto_to_flow(
 
     Returns:
         A tuple of (xflow, zflow) where:
-        - xflow: dict mapping node indices to sets of correction target indices
-        - zflow: dict mapping node indices to sets of correction target indices,
+        - xflow: dict mapping node indices to frozensets of correction target indices
+        - zflow: dict mapping node indices to frozensets of correction target indices,
                  or None if zflow is "auto"
+
+        The flows are read-only after conversion (and shared through the graph
+        context cache), so immutable frozensets are used.
     """
-    xflow: dict[int, set[int]] = {}
-    for node_id, targets in project.flow.xflow.items():
-        xflow[node_map[node_id]] = {node_map[t] for t in targets}
+    # ProjectPayloadDTO guarantees every flow reference is a project node, so no membership checks are needed
+    xflow = {
+        node_map[node_id]: frozenset([node_map[t] for t in targets]) for node_id, targets in project.flow.xflow.items()
+    }
 
     if project.flow.zflow == "auto":
         return xflow, None
 
-    zflow: dict[int, set[int]] = {}
-    for node_id, targets in project.flow.zflow.items():
-        zflow[node_map[node_id]] = {node_map[t] for t in targets}
-
+    zflow = {
+        node_map[node_id]: frozenset([node_map[t] for t in targets]) for node_id, targets in project.flow.zflow.items()
+    }
     return xflow, zflow
 
 
@@ -119,7 +173,7 @@ def schedule_to_dto(
     prepare_time: dict[int, int | None],
     measure_time: dict[int, int | None],
     entangle_time: dict[tuple[int, int], int | None],
-    timeline: Sequence[Any],  # TimeSlice from graphqomb
+    timeline: Sequence[TimeSlice],
     reverse_map: dict[int, str],
 ) -> ScheduleResultDTO:
     """Convert graphqomb schedule result to DTO.
@@ -134,47 +188,43 @@ def schedule_to_dto(
     Returns:
         A ScheduleResultDTO for the API response.
     """
-    # Convert prepare times
-    prepare_time_dto: dict[str, int | None] = {}
-    for node_id, time in prepare_time.items():
-        if node_id in reverse_map:
-            prepare_time_dto[reverse_map[node_id]] = time
-
-    # Convert measure times
-    measure_time_dto: dict[str, int | None] = {}
-    for node_id, time in measure_time.items():
-        if node_id in reverse_map:
-            measure_time_dto[reverse_map[node_id]] = time
+    # One probe per index; indices without a frontend ID are skipped
+    get_node_id = reverse_map.get
+    edge_id = normalize_edge_id
+
+    # Convert prepare and measure times
+    prepare_time_dto: dict[str, int | None] = {
+        node_id: time for node, time in prepare_time.items() if (node_id := get_node_id(node)) is not None
+    }
+    measure_time_dto: dict[str, int | None] = {
+        node_id: time for node, time in measure_time.items() if (node_id := get_node_id(node)) is not None
+    }
+
+    # Build each edge ID once; the timeline reuses the same edge tuples as entangle_time
+    edge_ids = {
+        (u, v): edge_id(u_id, v_id)
+        for u, v in entangle_time
+        if (u_id := get_node_id(u)) is not None and (v_id := get_node_id(v)) is not None
+    }
+    get_edge_id = edge_ids.get
 
     # Convert entangle times
-    entangle_time_dto: dict[str, int | None] = {}
-    for edge, time in entangle_time.items():
-        if edge[0] in reverse_map and edge[1] in reverse_map:
-            edge_id = normalize_edge_id(reverse_map[edge[0]], reverse_map[edge[1]])
-            entangle_time_dto[edge_id] = time
-
-    # Convert timeline
-    timeline_dto: list[TimeSliceDTO] = []
-    for i, ts in enumerate(timeline):
-        # TimeSlice has: prepare_nodes, entangle_edges, measure_nodes
-        prepare_nodes = [reverse_map[n] for n in ts.prepare_nodes if n in reverse_map]
-        measure_nodes = [reverse_map[n] for n in ts.measure_nodes if n in reverse_map]
-        entangle_edges = [
-            normalize_edge_id(reverse_map[e[0]], reverse_map[e[1]])
-            for e in ts.entangle_edges
-            if e[0] in reverse_map and e[1] in reverse_map
-        ]
-
-        timeline_dto.append(
-            TimeSliceDTO(
-                time=i,
-                prepareNodes=prepare_nodes,
-                entangleEdges=entangle_edges,
-                measureNodes=measure_nodes,
-            )
+    entangle_time_dto: dict[str, int | None] = {
+        eid: time for edge, time in entangle_time.items() if (eid := get_edge_id(edge)) is not None
+    }
+
+    # Convert timeline (built from trusted scheduler output, so skip validation)
+    timeline_dto = [
+        TimeSliceDTO.model_construct(
+            time=i,
+            prepareNodes=[node_id for n in ts.prepare_nodes if (node_id := get_node_id(n)) is not None],
+            entangleEdges=[eid for edge in ts.entangle_edges if (eid := get_edge_id(edge)) is not None],
+            measureNodes=[node_id for n in ts.measure_nodes if (node_id := get_node_id(n)) is not None],
         )
+        for i, ts in enumerate(timeline)
+    ]
 
-    return ScheduleResultDTO(
+    return ScheduleResultDTO.model_construct(
         prepareTime=prepare_time_dto,
         measureTime=measure_time_dto,
         entangleTime=entangle_time_dto,
@@ -185,39 +235,69 @@ def schedule_to_dto(
 def dto_to_schedule(
     schedule_dto: ScheduleResultDTO,
     node_map: dict[str, int],
+    edge_index: dict[str, tuple[int, int]],
 ) -> tuple[dict[int, int | None], dict[int, int | None], dict[tuple[int, int], int | None]]:
     """Convert ScheduleResultDTO to graphqomb schedule format.
 
+    Entangle times are looked up in ``edge_index`` first. Other keys, such as
+    reversed edge IDs in hand-edited or imported files, are resolved by their
+    endpoints; keys that do not name two project nodes are dropped, and
+    graphqomb ignores node pairs that are not graph edges.
+
     Args:
         schedule_dto: The schedule DTO from frontend.
         node_map: Mapping from frontend node IDs to graphqomb indices.
+        edge_index: Mapping from normalized edge IDs to graphqomb edges (see build_edge_index).
 
     Returns:
         Tuple of (prepare_time, measure_time, entangle_time) in graphqomb format.
     """
-    prepare_time: dict[int, int | None] = {}
-    for node_id, time in schedule_dto.prepareTime.items():
-        if node_id in node_map:
-            prepare_time[node_map[node_id]] = time
-
-    measure_time: dict[int, int | None] = {}
-    for node_id, time in schedule_dto.measureTime.items():
-        if node_id in node_map:
-            measure_time[node_map[node_id]] = time
-
-    entangle_time: dict[tuple[int, int], int | None] = {}
-    for edge_id, time in schedule_dto.entangleTime.items():
-        # Parse normalized edge ID (e.g., "n0-n1")
-        parts = edge_id.split("-")
-        if len(parts) == 2 and parts[0] in node_map and parts[1] in node_map:
-            u, v = node_map[parts[0]], node_map[parts[1]]
-            # Use canonical order (smaller index first)
-            edge = (min(u, v), max(u, v))
-            entangle_time[edge] = time
+    get_node = node_map.get
+    prepare_time: dict[int, int | None] = {
+        node: time for node_id, time in schedule_dto.prepareTime.items() if (node := get_node(node_id)) is not None
+    }
+    measure_time: dict[int, int | None] = {
+        node: time for node_id, time in schedule_dto.measureTime.items() if (node := get_node(node_id)) is not None
+    }
+
+    get_edge = edge_index.get
+    entangle_time: dict[tuple[int, int], int | None] = {
+        edge: time
+        for edge_id, time in schedule_dto.entangleTime.items()
+        if (edge := get_edge(edge_id) or _split_edge_id(edge_id, node_map)) is not None
+    }
 
     return prepare_time, measure_time, entangle_time
 
 
+def _split_edge_id(edge_id: str, node_map: dict[str, int]) -> tuple[int, int] | None:
+    """Resolve an edge ID that is not in the edge index to a canonical node pair.
+
+    Node IDs may contain ``-``, so each separator is tried until both sides
+    are project node IDs.
+    """
+    sep = edge_id.find("-")
+    while sep != -1:
+        u = node_map.get(edge_id[:sep])
+        v = node_map.get(edge_id[sep + 1 :])
+        if u is not None and v is not None:
+            return (u, v) if u < v else (v, u)
+        sep = edge_id.find("-", sep + 1)
+    return None
+
+
+def _replace_node_indices(reverse_map: dict[int, str], match: re.Match[str]) -> str:
+    """Replace an index list, single node, or edge match with node IDs."""
+    if (indices := match["indices"]) is not None:
+        node_ids = [reverse_map.get(i, f"?{i}") for i in map(int, indices.split(","))]
+        return f"[{', '.join(node_ids)}]"
+    if (node := match["node"]) is not None:
+        idx = int(node)
+        return f"node {reverse_map.get(idx, f'?{idx}')}"
+    u, v = int(match["u"]), int(match["v"])
+    return f"{match['prefix']} ({reverse_map.get(u, f'?{u}')}, {reverse_map.get(v, f'?{v}')})"
+
+
 def translate_error_message(message: str, reverse_map: dict[int, str]) -> str:
     """Translate graphqomb error message by replacing node indices with node IDs.
 
@@ -228,43 +308,15 @@ def translate_error_message(message: str, reverse_map: dict[int, str]) -> str:
     Returns:
         Error message with node indices replaced by frontend node IDs.
     """
-    import re
-
-    result = message
-
-    # Replace patterns like [0, 2, 5] (list of indices)
-    def replace_index_list(match: re.Match[str]) -> str:
-        indices_str = match.group(1)
-        indices = [int(i.strip()) for i in indices_str.split(",")]
-        node_ids = [reverse_map.get(i, f"?{i}") for i in indices]
-        return f"[{', '.join(node_ids)}]"
-
-    result = re.sub(r"\[(\d+(?:,\s*\d+)*)\]", replace_index_list, result)
-
-    # Replace patterns like "node 0" or "node 123"
-    def replace_single_node(match: re.Match[str]) -> str:
-        idx = int(match.group(1))
-        node_id = reverse_map.get(idx, f"?{idx}")
-        return f"node {node_id}"
-
-    result = re.sub(r"\bnode (\d+)", replace_single_node, result)
-
-    # Replace patterns like "Edge (0, 1)" or "edge (2, 3)"
-    def replace_edge(match: re.Match[str]) -> str:
-        prefix = match.group(1)  # "Edge" or "edge"
-        u, v = int(match.group(2)), int(match.group(3))
-        u_id = reverse_map.get(u, f"?{u}")
-        v_id = reverse_map.get(v, f"?{v}")
-        return f"{prefix} ({u_id}, {v_id})"
-
-    result = re.sub(r"\b(Edge|edge) \((\d+), (\d+)\)", replace_edge, result)
-
-    return result
+    # Every pattern needs a digit, so messages without one cannot change
+    if _DIGIT_PATTERN.search(message) is None:
+        return message
+    return _NODE_INDEX_PATTERN.sub(partial(_replace_node_indices, reverse_map), message)
 
 
 def compute_zflow_from_xflow(
     graph: GraphState,
-    xflow: dict[int, set[int]],
+    xflow: Mapping[int, AbstractSet[int]],
 ) -> dict[int, set[int]]:
     """Compute z-flow from x-flow using odd_neighbors.
 
@@ -275,17 +327,11 @@ def compute_zflow_from_xflow(
     Returns:
         The computed z-flow mapping.
     """
-    from graphqomb.graphstate import odd_neighbors
-
-    zflow: dict[int, set[int]] = {}
-    for node, targets in xflow.items():
-        zflow[node] = odd_neighbors(targets, graph)
-
-    return zflow
+    return {node: odd_neighbors(targets, graph) for node, targets in xflow.items()}
 
 
 def zflow_to_dto(
-    zflow: dict[int, set[int]],
+    zflow: Mapping[int, AbstractSet[int]],
     reverse_map: dict[int, str],
 ) -> dict[str, list[str]]:
     """Convert graphqomb z-flow to frontend format.
@@ -297,8 +343,15 @@ def zflow_to_dto(
     Returns:
         The z-flow in frontend format (node IDs to lists of target IDs).
     """
+    get_id = reverse_map.get
+    lookup = reverse_map.__getitem__
     result: dict[str, list[str]] = {}
-    for node_id, targets in zflow.items():
-        if node_id in reverse_map:
-            result[reverse_map[node_id]] = [reverse_map[t] for t in targets if t in reverse_map]
+    for node, targets in zflow.items():
+        if (node_id := get_id(node)) is None:
+            continue
+        try:
+            # Targets come from the same graph, so a batched lookup through map() normally succeeds
+            result[node_id] = list(map(lookup, targets))
+        except KeyError:
+            result[node_id] = [target_id for t in targets if (target_id := get_id(t)) is not None]
     return result
@@ -0,0 +1,26 @@
+"""Shared test fixtures.
+
+The application is imported here only, so each test process (including
+pytest-xdist workers) builds the app and its routers once.
+"""
+
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.main import app as _app
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Provide the API application shared by the whole test session."""
+    return _app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """Provide one in-process API client shared by every test in the session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as shared_client:
+        yield shared_client
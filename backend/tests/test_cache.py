@@ -0,0 +1,58 @@
+"""Result cache tests."""
+
+import time
+
+import pytest
+from src.models.dto import FlowDefinitionDTO
+from src.services.cache import LRUCache, content_digest
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is evicted when the cache is full."""
+    cache = LRUCache[str, int](maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_clear() -> None:
+    """Test clearing removes every entry."""
+    cache = LRUCache[str, int](maxsize=2)
+    cache.put("a", 1)
+
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_expires_entries_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test entries older than the TTL are treated as missing."""
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = LRUCache[str, int](maxsize=2, ttl=10)
+    cache.put("a", 1)
+
+    now = 105.0
+    assert cache.get("a") == 1
+
+    now = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_content_digest_depends_on_content() -> None:
+    """Test equal models share a digest and different models do not."""
+    flow = FlowDefinitionDTO(xflow={"n0": ["n1"]}, zflow="auto")
+    same_flow = FlowDefinitionDTO(xflow={"n0": ["n1"]}, zflow="auto")
+    other_flow = FlowDefinitionDTO(xflow={"n0": ["n2"]}, zflow="auto")
+
+    assert content_digest(flow) == content_digest(same_flow)
+    assert content_digest(flow) != content_digest(other_flow)
@@ -0,0 +1,136 @@
+"""Converter service tests."""
+
+import math
+
+from graphqomb.common import Axis, AxisMeasBasis, Plane, PlannerMeasBasis, Sign
+from graphqomb.scheduler import TimeSlice
+from src.models.dto import AxisMeasBasisDTO, PlannerMeasBasisDTO, ScheduleResultDTO
+from src.services.converter import (
+    dto_to_meas_basis,
+    dto_to_schedule,
+    schedule_to_dto,
+    translate_error_message,
+    zflow_to_dto,
+)
+
+
+def test_dto_to_meas_basis_planner() -> None:
+    """Test planner bases map the plane and scale the angle coefficient by 2*pi."""
+    basis = dto_to_meas_basis(PlannerMeasBasisDTO(type="planner", plane="YZ", angleCoeff=0.25))
+
+    assert isinstance(basis, PlannerMeasBasis)
+    assert basis.plane == Plane.YZ
+    assert math.isclose(basis.angle, math.pi / 2)
+
+
+def test_dto_to_meas_basis_axis() -> None:
+    """Test axis bases map the axis and sign names."""
+    basis = dto_to_meas_basis(AxisMeasBasisDTO(type="axis", axis="Z", sign="MINUS"))
+
+    assert isinstance(basis, AxisMeasBasis)
+    assert basis.axis == Axis.Z
+    assert basis.sign == Sign.MINUS
+
+
+def test_schedule_to_dto_maps_indices_to_node_ids() -> None:
+    """Test schedule conversion uses frontend node IDs and normalized edge IDs."""
+    reverse_map = {0: "b", 1: "a", 2: "c"}
+
+    result = schedule_to_dto(
+        prepare_time={1: 0, 2: 1},
+        measure_time={0: 1, 1: 2},
+        entangle_time={(0, 1): 0, (1, 2): 1},
+        timeline=[
+            TimeSlice(prepare_nodes={1}, entangle_edges={(0, 1)}, measure_nodes=set()),
+            TimeSlice(prepare_nodes={2}, entangle_edges={(1, 2)}, measure_nodes={0}),
+            TimeSlice(prepare_nodes=set(), entangle_edges=set(), measure_nodes={1}),
+        ],
+        reverse_map=reverse_map,
+    )
+
+    assert result.prepareTime == {"a": 0, "c": 1}
+    assert result.measureTime == {"b": 1, "a": 2}
+    assert result.entangleTime == {"a-b": 0, "a-c": 1}
+    assert [ts.time for ts in result.timeline] == [0, 1, 2]
+    assert result.timeline[0].prepareNodes == ["a"]
+    assert result.timeline[0].entangleEdges == ["a-b"]
+    assert result.timeline[1].measureNodes == ["b"]
+    assert result.timeline[2].measureNodes == ["a"]
+
+
+def test_schedule_to_dto_skips_unknown_indices() -> None:
+    """Test schedule conversion ignores indices without a frontend node ID."""
+    result = schedule_to_dto(
+        prepare_time={0: 0, 1: 1, 5: 2, -1: 3},
+        measure_time={7: 1, -2: 2},
+        entangle_time={(0, 1): 0, (0, 2): 1, (2, 9): 2},
+        timeline=[TimeSlice(prepare_nodes={0, 1, 5}, entangle_edges={(0, 1), (0, 2)}, measure_nodes={-1})],
+        reverse_map={0: "n0", 2: "n2"},
+    )
+
+    assert result.prepareTime == {"n0": 0}
+    assert result.measureTime == {}
+    assert result.entangleTime == {"n0-n2": 1}
+    assert result.timeline[0].prepareNodes == ["n0"]
+    assert result.timeline[0].entangleEdges == ["n0-n2"]
+    assert result.timeline[0].measureNodes == []
+
+
+def test_translate_error_message_replaces_node_indices() -> None:
+    """Test index lists, single nodes, and edges are rewritten to node IDs."""
+    reverse_map = {0: "a", 1: "b", 2: "c"}
+
+    message = translate_error_message(
+        "Nodes [0, 2, 7] invalid; node 1 measured early; Edge (0, 1) and edge (2, 9) out of order",
+        reverse_map,
+    )
+
+    assert message == "Nodes [a, c, ?7] invalid; node b measured early; Edge (a, b) and edge (c, ?9) out of order"
+
+
+def test_dto_to_schedule_resolves_edges_through_edge_index() -> None:
+    """Test entangle times are resolved by edge ID, including node IDs containing hyphens."""
+    node_map = {"q-1": 0, "q-2": 1}
+    schedule = ScheduleResultDTO(
+        prepareTime={"q-1": None, "q-2": 0},
+        measureTime={"q-1": 1, "q-2": None},
+        entangleTime={"q-1-q-2": 0, "q-1-missing": 1},
+        timeline=[],
+    )
+
+    prepare_time, measure_time, entangle_time = dto_to_schedule(schedule, node_map, {"q-1-q-2": (0, 1)})
+
+    assert prepare_time == {0: None, 1: 0}
+    assert measure_time == {0: 1, 1: None}
+    assert entangle_time == {(0, 1): 0}
+
+
+def test_dto_to_schedule_resolves_edge_ids_missing_from_edge_index() -> None:
+    """Test reversed or unnormalized edge IDs fall back to their endpoints instead of being dropped."""
+    node_map = {"a": 0, "b": 1, "q-1": 2}
+    schedule = ScheduleResultDTO(
+        prepareTime={},
+        measureTime={},
+        entangleTime={"b-a": 5, "q-1-b": 2, "a-missing": 3},
+        timeline=[],
+    )
+
+    _, _, entangle_time = dto_to_schedule(schedule, node_map, {"a-b": (0, 1), "b-q-1": (1, 2)})
+
+    assert entangle_time == {(0, 1): 5, (1, 2): 2}
+
+
+def test_zflow_to_dto_skips_unmapped_indices() -> None:
+    """Test z-flow conversion maps known indices and drops unknown sources and targets."""
+    reverse_map = {0: "a", 1: "b", 2: "c"}
+
+    result = zflow_to_dto({0: {1, 2}, 1: {2, 5}, 7: {0}}, reverse_map)
+
+    assert {node: sorted(targets) for node, targets in result.items()} == {"a": ["b", "c"], "b": ["c"]}
+
+
+def test_translate_error_message_without_indices_is_unchanged() -> None:
+    """Test messages without node indices are returned as-is."""
+    message = "Schedule is not set"
+
+    assert translate_error_message(message, {0: "a"}) is message
@@ -1,18 +1,31 @@
 """DTO validation tests."""
 
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from src.models.dto import (
     AxisMeasBasisDTO,
     CoordinateDTO,
     FlowDefinitionDTO,
     GraphEdgeDTO,
     GraphNodeDTO,
+    InputNodeDTO,
+    IntermediateNodeDTO,
+    OutputNodeDTO,
     PlannerMeasBasisDTO,
     ProjectPayloadDTO,
     normalize_edge_id,
 )
 
+GRAPH_NODE_ADAPTER: TypeAdapter[GraphNodeDTO] = TypeAdapter(GraphNodeDTO)
+PLANNER_BASIS = {"type": "planner", "plane": "XY", "angleCoeff": 0}
+
+
+def make_node(role: str, **fields: Any) -> dict[str, Any]:
+    """Create a raw node payload with the given role and extra fields."""
+    return {"id": "n0", "coordinate": {"x": 0, "y": 0, "z": 0}, "role": role, **fields}
+
 
 class TestNormalizeEdgeId:
     """Tests for edge ID normalization."""
@@ -78,6 +91,20 @@ class TestMeasBasis:
         with pytest.raises(ValidationError):
             PlannerMeasBasisDTO(type="planner", plane="AB", angleCoeff=0.25)  # type: ignore[arg-type]
 
+    def test_node_meas_basis_dispatches_on_type(self) -> None:
+        """Test node measurement bases are parsed by their type tag."""
+        node = GRAPH_NODE_ADAPTER.validate_python(
+            make_node("intermediate", measBasis={"type": "axis", "axis": "Z", "sign": "MINUS"})
+        )
+        assert isinstance(node.measBasis, AxisMeasBasisDTO)
+
+    def test_node_meas_basis_rejects_unknown_type(self) -> None:
+        """Test node measurement bases require a known type tag."""
+        with pytest.raises(ValidationError, match="union_tag_invalid"):
+            GRAPH_NODE_ADAPTER.validate_python(
+                make_node("intermediate", measBasis={"type": "pauli", "axis": "Z", "sign": "MINUS"})
+            )
+
     def test_axis_invalid_axis(self) -> None:
         """Test axis basis rejects invalid axis."""
         with pytest.raises(ValidationError):
@@ -87,9 +114,26 @@ class TestMeasBasis:
 class TestGraphNode:
     """Tests for graph node DTO."""
 
+    def test_role_selects_node_variant(self) -> None:
+        """Test nodes are parsed into the variant matching their role."""
+        assert isinstance(
+            GRAPH_NODE_ADAPTER.validate_python(make_node("input", measBasis=PLANNER_BASIS, qubitIndex=0)),
+            InputNodeDTO,
+        )
+        assert isinstance(GRAPH_NODE_ADAPTER.validate_python(make_node("output", qubitIndex=0)), OutputNodeDTO)
+        assert isinstance(
+            GRAPH_NODE_ADAPTER.validate_python(make_node("intermediate", measBasis=PLANNER_BASIS)),
+            IntermediateNodeDTO,
+        )
+
+    def test_unknown_role(self) -> None:
+        """Test nodes require a known role."""
+        with pytest.raises(ValidationError, match="union_tag_invalid"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("ancilla", measBasis=PLANNER_BASIS))
+
     def test_input_node_valid(self) -> None:
         """Test valid input node."""
-        node = GraphNodeDTO(
+        node = InputNodeDTO(
             id="n0",
             coordinate=CoordinateDTO(x=0, y=0, z=0),
             role="input",
@@ -100,7 +144,7 @@ class TestGraphNode:
 
     def test_input_node_with_input_basis(self) -> None:
         """Test input nodes accept a Pauli initialization basis."""
-        node = GraphNodeDTO(
+        node = InputNodeDTO(
             id="n0",
             coordinate=CoordinateDTO(x=0, y=0, z=0),
             role="input",
@@ -112,27 +156,17 @@ class TestGraphNode:
 
     def test_input_node_missing_meas_basis(self) -> None:
         """Test input node requires measBasis."""
-        with pytest.raises(ValidationError, match="input node requires measBasis"):
-            GraphNodeDTO(
-                id="n0",
-                coordinate=CoordinateDTO(x=0, y=0, z=0),
-                role="input",
-                qubitIndex=0,
-            )
+        with pytest.raises(ValidationError, match=r"input\.measBasis\n  Field required"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("input", qubitIndex=0))
 
     def test_input_node_missing_qubit_index(self) -> None:
         """Test input node requires qubitIndex."""
-        with pytest.raises(ValidationError, match="input node requires qubitIndex"):
-            GraphNodeDTO(
-                id="n0",
-                coordinate=CoordinateDTO(x=0, y=0, z=0),
-                role="input",
-                measBasis=PlannerMeasBasisDTO(type="planner", plane="XY", angleCoeff=0),
-            )
+        with pytest.raises(ValidationError, match=r"input\.qubitIndex\n  Field required"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("input", measBasis=PLANNER_BASIS))
 
     def test_output_node_valid(self) -> None:
         """Test valid output node."""
-        node = GraphNodeDTO(
+        node = OutputNodeDTO(
             id="n0",
             coordinate=CoordinateDTO(x=0, y=0, z=0),
             role="output",
@@ -142,7 +176,7 @@ class TestGraphNode:
 
     def test_output_node_with_meas_basis(self) -> None:
         """Test measured output node."""
-        node = GraphNodeDTO(
+        node = OutputNodeDTO(
             id="n0",
             coordinate=CoordinateDTO(x=0, y=0, z=0),
             role="output",
@@ -151,20 +185,19 @@ class TestGraphNode:
         )
         assert node.measBasis is not None
 
+    def test_output_node_missing_qubit_index(self) -> None:
+        """Test output node requires qubitIndex."""
+        with pytest.raises(ValidationError, match=r"output\.qubitIndex\n  Field required"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("output"))
+
     def test_output_node_with_input_basis(self) -> None:
         """Test output nodes reject input initialization bases."""
-        with pytest.raises(ValidationError, match="output node must not have inputBasis"):
-            GraphNodeDTO(
-                id="n0",
-                coordinate=CoordinateDTO(x=0, y=0, z=0),
-                role="output",
-                qubitIndex=0,
-                inputBasis="Z",
-            )
+        with pytest.raises(ValidationError, match=r"output\.inputBasis\n  Input should be None"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("output", qubitIndex=0, inputBasis="Z"))
 
     def test_intermediate_node_valid(self) -> None:
         """Test valid intermediate node."""
-        node = GraphNodeDTO(
+        node = IntermediateNodeDTO(
             id="n0",
             coordinate=CoordinateDTO(x=0, y=0, z=0),
             role="intermediate",
@@ -172,27 +205,20 @@ class TestGraphNode:
         )
         assert node.role == "intermediate"
 
+    def test_intermediate_node_missing_meas_basis(self) -> None:
+        """Test intermediate node requires measBasis."""
+        with pytest.raises(ValidationError, match=r"intermediate\.measBasis\n  Field required"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("intermediate"))
+
     def test_intermediate_node_with_qubit_index(self) -> None:
         """Test intermediate node must not have qubitIndex."""
-        with pytest.raises(ValidationError, match="intermediate node must not have qubitIndex"):
-            GraphNodeDTO(
-                id="n0",
-                coordinate=CoordinateDTO(x=0, y=0, z=0),
-                role="intermediate",
-                measBasis=PlannerMeasBasisDTO(type="planner", plane="XY", angleCoeff=0),
-                qubitIndex=0,
-            )
+        with pytest.raises(ValidationError, match=r"intermediate\.qubitIndex\n  Input should be None"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("intermediate", measBasis=PLANNER_BASIS, qubitIndex=0))
 
     def test_intermediate_node_with_input_basis(self) -> None:
         """Test intermediate nodes reject input initialization bases."""
-        with pytest.raises(ValidationError, match="intermediate node must not have inputBasis"):
-            GraphNodeDTO(
-                id="n0",
-                coordinate=CoordinateDTO(x=0, y=0, z=0),
-                role="intermediate",
-                measBasis=PlannerMeasBasisDTO(type="planner", plane="XY", angleCoeff=0),
-                inputBasis="Y",
-            )
+        with pytest.raises(ValidationError, match=r"intermediate\.inputBasis\n  Input should be None"):
+            GRAPH_NODE_ADAPTER.validate_python(make_node("intermediate", measBasis=PLANNER_BASIS, inputBasis="Y"))
 
 
 class TestGraphEdge:
@@ -208,11 +234,6 @@ class TestGraphEdge:
         edge = GraphEdgeDTO(id="a-b", source="b", target="a")
         assert edge.id == "a-b"
 
-    def test_invalid_edge_id(self) -> None:
-        """Test edge with non-normalized ID is rejected."""
-        with pytest.raises(ValidationError, match="Edge id must be normalized"):
-            GraphEdgeDTO(id="b-a", source="a", target="b")
-
 
 class TestFlowDefinition:
     """Tests for flow definition DTO."""
@@ -242,14 +263,14 @@ class TestProjectPayload:
         project = ProjectPayloadDTO(
             name="Test",
             nodes=[
-                GraphNodeDTO(
+                InputNodeDTO(
                     id="n0",
                     coordinate=CoordinateDTO(x=0, y=0, z=0),
                     role="input",
                     measBasis=PlannerMeasBasisDTO(type="planner", plane="XY", angleCoeff=0),
                     qubitIndex=0,
                 ),
-                GraphNodeDTO(
+                OutputNodeDTO(
                     id="n1",
                     coordinate=CoordinateDTO(x=1, y=0, z=0),
                     role="output",
@@ -264,3 +285,27 @@ class TestProjectPayload:
         assert project.name == "Test"
         assert len(project.nodes) == 2
         assert len(project.edges) == 1
+
+    def test_invalid_edge_id(self) -> None:
+        """Test project with a non-normalized edge ID is rejected."""
+        with pytest.raises(ValidationError, match="Edge id must be normalized"):
+            ProjectPayloadDTO(
+                name="Test",
+                nodes=[
+                    InputNodeDTO(
+                        id="a",
+                        coordinate=CoordinateDTO(x=0, y=0, z=0),
+                        role="input",
+                        measBasis=PlannerMeasBasisDTO(type="planner", plane="XY", angleCoeff=0),
+                        qubitIndex=0,
+                    ),
+                    OutputNodeDTO(
+                        id="b",
+                        coordinate=CoordinateDTO(x=1, y=0, z=0),
+                        role="output",
+                        qubitIndex=0,
+                    ),
+                ],
+                edges=[GraphEdgeDTO(id="b-a", source="a", target="b")],
+                flow=FlowDefinitionDTO(xflow={}, zflow="auto"),
+            )
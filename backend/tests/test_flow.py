@@ -2,8 +2,15 @@
 
 from typing import Any
 
-from httpx import ASGITransport, AsyncClient
-from src.main import app
+import pytest
+from httpx import AsyncClient
+from src.routers import flow as flow_router
+
+
+@pytest.fixture(autouse=True)
+def clear_zflow_cache() -> None:
+    """Start every test without cached z-flow results."""
+    flow_router.ZFLOW_CACHE.clear()
 
 
 def create_project_with_xflow() -> dict[str, Any]:
@@ -39,13 +46,9 @@ def create_project_with_xflow() -> dict[str, Any]:
     }
 
 
-async def test_compute_zflow() -> None:
+async def test_compute_zflow(client: AsyncClient) -> None:
     """Test computing zflow from xflow."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/compute-zflow", json=create_project_with_xflow())
+    response = await client.post("/api/compute-zflow", json=create_project_with_xflow())
 
     assert response.status_code == 200
     data: dict[str, list[str]] = response.json()
@@ -62,7 +65,7 @@ async def test_compute_zflow() -> None:
         assert isinstance(value, list)
 
 
-async def test_compute_zflow_empty_xflow() -> None:
+async def test_compute_zflow_empty_xflow(client: AsyncClient) -> None:
     """Test computing zflow with empty xflow."""
     project: dict[str, Any] = {
         "name": "Empty Flow",
@@ -85,11 +88,7 @@ async def test_compute_zflow_empty_xflow() -> None:
         "flow": {"xflow": {}, "zflow": "auto"},
     }
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/compute-zflow", json=project)
+    response = await client.post("/api/compute-zflow", json=project)
 
     assert response.status_code == 200
     data = response.json()
@@ -98,7 +97,7 @@ async def test_compute_zflow_empty_xflow() -> None:
     assert data == {}
 
 
-async def test_compute_zflow_empty_project() -> None:
+async def test_compute_zflow_empty_project(client: AsyncClient) -> None:
     """Test computing zflow for empty project."""
     project: dict[str, Any] = {
         "name": "Empty",
@@ -107,32 +106,24 @@ async def test_compute_zflow_empty_project() -> None:
         "flow": {"xflow": {}, "zflow": "auto"},
     }
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/compute-zflow", json=project)
+    response = await client.post("/api/compute-zflow", json=project)
 
     assert response.status_code == 200
     data = response.json()
     assert data == {}
 
 
-async def test_compute_zflow_rejects_unknown_xflow_reference() -> None:
+async def test_compute_zflow_rejects_unknown_xflow_reference(client: AsyncClient) -> None:
     """Test computing zflow rejects unknown xflow targets."""
     project = create_project_with_xflow()
     project["flow"] = {"xflow": {"n0": ["missing"]}, "zflow": "auto"}
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/compute-zflow", json=project)
+    response = await client.post("/api/compute-zflow", json=project)
 
     assert response.status_code == 422
 
 
-async def test_compute_zflow_multi_z_project() -> None:
+async def test_compute_zflow_multi_z_project(client: AsyncClient) -> None:
     """Test computing zflow for project with nodes at different Z levels."""
     project = {
         "name": "Multi-Z Flow Test",
@@ -164,11 +155,7 @@ async def test_compute_zflow_multi_z_project() -> None:
         "flow": {"xflow": {"n0": ["n1"], "n1": ["n2"]}, "zflow": "auto"},
     }
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/compute-zflow", json=project)
+    response = await client.post("/api/compute-zflow", json=project)
 
     assert response.status_code == 200
     data = response.json()
@@ -5,8 +5,7 @@ from typing import Any
 import pytest
 from graphqomb.common import Axis
 from graphqomb.pauli_frame import PauliFrame
-from httpx import ASGITransport, AsyncClient
-from src.main import app
+from httpx import AsyncClient
 
 
 def closure_project() -> dict[str, Any]:
@@ -73,10 +72,9 @@ def single_node_project(meas_basis: dict[str, Any], *, input_basis: str | None =
     }
 
 
-async def test_compile_ftqc_expands_detectors_and_logical_observables() -> None:
+async def test_compile_ftqc_expands_detectors_and_logical_observables(client: AsyncClient) -> None:
     """Detector and observable seeds are expanded through their dependent chains."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=closure_project())
+    response = await client.post("/api/compile-ftqc", json=closure_project())
 
     assert response.status_code == 200
     assert response.json() == {
@@ -102,12 +100,11 @@ async def test_compile_ftqc_expands_detectors_and_logical_observables() -> None:
     }
 
 
-async def test_compile_ftqc_reports_z_measurement_support_mismatch() -> None:
+async def test_compile_ftqc_reports_z_measurement_support_mismatch(client: AsyncClient) -> None:
     """A lone Z measurement on an X-initialized node is non-deterministic in GraphQOMB 0.5.2."""
     project = single_node_project({"type": "axis", "axis": "Z", "sign": "PLUS"})
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 200
     assert response.json()["detectorDiagnostics"] == [
@@ -128,7 +125,7 @@ async def test_compile_ftqc_reports_z_measurement_support_mismatch() -> None:
     ]
 
 
-async def test_compile_ftqc_reports_stabilizer_support_outside_detector_group() -> None:
+async def test_compile_ftqc_reports_stabilizer_support_outside_detector_group(client: AsyncClient) -> None:
     """A Pauli-equivalent planner basis outside the detector is reported as its Pauli axis."""
     project = single_node_project({"type": "axis", "axis": "X", "sign": "PLUS"})
     project["nodes"].append(
@@ -141,8 +138,7 @@ async def test_compile_ftqc_reports_stabilizer_support_outside_detector_group()
     )
     project["edges"] = [{"id": "n0-n1", "source": "n0", "target": "n1"}]
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 200
     assert response.json()["detectorDiagnostics"] == [
@@ -164,6 +160,7 @@ async def test_compile_ftqc_reports_stabilizer_support_outside_detector_group()
 
 
 async def test_compile_ftqc_distinguishes_non_pauli_measurement(
+    client: AsyncClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """A present non-Pauli basis is not reported as missing detector support."""
@@ -182,8 +179,7 @@ async def test_compile_ftqc_distinguishes_non_pauli_measurement(
     monkeypatch.setattr(PauliFrame, "detector_determinism", detector_determinism)
     monkeypatch.setattr(PauliFrame, "detector_stabilizers", detector_stabilizers)
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 200
     assert response.json()["detectorDiagnostics"] == [
@@ -204,60 +200,55 @@ async def test_compile_ftqc_distinguishes_non_pauli_measurement(
     ]
 
 
-async def test_compile_ftqc_reports_deterministic_detector_without_mismatches() -> None:
+async def test_compile_ftqc_reports_deterministic_detector_without_mismatches(client: AsyncClient) -> None:
     """Matching preparation and measurement support yields a clean diagnostic."""
     project = single_node_project(
         {"type": "axis", "axis": "Z", "sign": "PLUS"},
         input_basis="Z",
     )
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 200
     assert response.json()["detectorDiagnostics"] == [{"deterministic": True, "mismatches": []}]
 
 
-async def test_compile_ftqc_resolves_auto_zflow() -> None:
+async def test_compile_ftqc_resolves_auto_zflow(client: AsyncClient) -> None:
     """Projects using Studio's automatic z-flow can compile closure groups."""
     project = closure_project()
     project["flow"]["zflow"] = "auto"
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 200
     assert response.json()["parityCheckGroup"] == [["n0", "n1"]]
 
 
-async def test_compile_ftqc_rejects_unknown_detector_node() -> None:
+async def test_compile_ftqc_rejects_unknown_detector_node(client: AsyncClient) -> None:
     """Invalid detector node references are rejected at the request boundary."""
     project = closure_project()
     project["ftqc"]["parityCheckGroup"] = [["missing"]]
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 422
 
 
-async def test_compile_ftqc_rejects_unknown_logical_observable_node() -> None:
+async def test_compile_ftqc_rejects_unknown_logical_observable_node(client: AsyncClient) -> None:
     """Invalid logical-observable node references are rejected at the request boundary."""
     project = closure_project()
     project["ftqc"]["logicalObservableGroup"] = {"0": ["missing"]}
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 422
 
 
-async def test_compile_ftqc_rejects_misaligned_detector_tags() -> None:
+async def test_compile_ftqc_rejects_misaligned_detector_tags(client: AsyncClient) -> None:
     """Detector tags must stay aligned with parity check groups."""
     project = closure_project()
     project["ftqc"]["parityCheckTags"] = ["type=flag", ""]
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.post("/api/compile-ftqc", json=project)
+    response = await client.post("/api/compile-ftqc", json=project)
 
     assert response.status_code == 422
@@ -1,65 +1,61 @@
 """Health check endpoint tests."""
 
-from httpx import ASGITransport, AsyncClient
-from src.main import app
+from httpx import AsyncClient
 
 
-async def test_health_check() -> None:
+async def test_health_check(client: AsyncClient) -> None:
     """Test health check endpoint returns ok status."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.get("/health")
+    response = await client.get("/health")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
-async def test_health_check_method_not_allowed() -> None:
+async def test_health_check_method_not_allowed(client: AsyncClient) -> None:
     """Test health check endpoint rejects POST method."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/health")
+    response = await client.post("/health")
 
     assert response.status_code == 405
 
 
-async def test_cors_allows_cli_frontend_origin() -> None:
+async def test_cors_allows_cli_frontend_origin(client: AsyncClient) -> None:
     """CLI-opened frontend origins can fetch backend API routes."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.options(
-            "/api/import-session/token",
-            headers={
-                "Origin": "http://127.0.0.1:3000",
-                "Access-Control-Request-Method": "GET",
-                "Access-Control-Request-Headers": "content-type",
-            },
-        )
+    response = await client.options(
+        "/api/import-session/token",
+        headers={
+            "Origin": "http://127.0.0.1:3000",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
 
     assert response.status_code == 200
     assert response.headers["access-control-allow-origin"] == "http://127.0.0.1:3000"
 
 
-async def test_cors_allows_custom_local_frontend_port() -> None:
+async def test_cors_allows_custom_local_frontend_port(client: AsyncClient) -> None:
     """Custom CLI frontend ports are also valid local development origins."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.options(
-            "/api/import-session/token",
-            headers={
-                "Origin": "http://localhost:3010",
-                "Access-Control-Request-Method": "GET",
-                "Access-Control-Request-Headers": "content-type",
-            },
-        )
+    response = await client.options(
+        "/api/import-session/token",
+        headers={
+            "Origin": "http://localhost:3010",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
 
     assert response.status_code == 200
     assert response.headers["access-control-allow-origin"] == "http://localhost:3010"
+
+
+async def test_cors_rejects_unused_method(client: AsyncClient) -> None:
+    """Preflight requests for methods the API does not use are rejected."""
+    response = await client.options(
+        "/api/import-session/token",
+        headers={
+            "Origin": "http://localhost:3000",
+            "Access-Control-Request-Method": "DELETE",
+        },
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,62 @@
+"""OpenAPI document tests."""
+
+from collections.abc import Iterator
+from typing import Any, cast
+
+import pytest
+from httpx import AsyncClient
+
+
+def _iter_refs(node: object) -> Iterator[str]:
+    """Yield every ``$ref`` value nested anywhere in ``node``."""
+    if isinstance(node, dict):
+        for key, value in cast("dict[str, object]", node).items():
+            if key == "$ref" and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_refs(value)
+    elif isinstance(node, list):
+        for item in cast("list[object]", node):
+            yield from _iter_refs(item)
+
+
+def _resolve(document: dict[str, Any], ref: str) -> object:
+    """Resolve a local JSON pointer ``ref`` against ``document``."""
+    assert ref.startswith("#/"), ref
+    node: object = document
+    for part in ref[2:].split("/"):
+        assert isinstance(node, dict), f"unresolved $ref {ref}"
+        parent = cast("dict[str, object]", node)
+        assert part in parent, f"unresolved $ref {ref}"
+        node = parent[part]
+    return node
+
+
+async def test_openapi_refs_resolve(client: AsyncClient) -> None:
+    """Every $ref in the OpenAPI document points at an existing definition."""
+    response = await client.get("/openapi.json")
+
+    assert response.status_code == 200
+    document = response.json()
+    for ref in set(_iter_refs(document)):
+        _resolve(document, ref)
+
+
+@pytest.mark.parametrize(
+    ("path", "model"),
+    [
+        ("/api/validate", "ProjectPayloadDTO"),
+        ("/api/schedule", "ProjectPayloadDTO"),
+        ("/api/compute-zflow", "ProjectPayloadDTO"),
+        ("/api/compile-ftqc", "ProjectPayloadDTO"),
+        ("/api/validate-schedule", "ScheduleValidationRequestDTO"),
+    ],
+)
+async def test_openapi_documents_json_body(client: AsyncClient, path: str, model: str) -> None:
+    """Routes parsing their body with json_body document it as a component schema."""
+    document = (await client.get("/openapi.json")).json()
+
+    request_body = document["paths"][path]["post"]["requestBody"]
+    assert request_body["required"] is True
+    assert request_body["content"]["application/json"]["schema"] == {"$ref": f"#/components/schemas/{model}"}
+    assert model in document["components"]["schemas"]
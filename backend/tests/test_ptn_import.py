@@ -5,9 +5,8 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 from src import cli
-from src.main import app
 from src.services import import_sessions
 from src.services.ptn_import import ptn_text_to_project
 
@@ -142,65 +141,50 @@ def test_ptn_text_to_project_imports_measured_output() -> None:
     assert project["schedule"]["measureTime"]["n2"] == 2
 
 
-async def test_measured_output_import_is_accepted_by_validate_api() -> None:
+async def test_measured_output_import_is_accepted_by_validate_api(client: AsyncClient) -> None:
     """Projects imported with measured outputs are accepted by the validation API."""
     project = ptn_text_to_project(measured_output_ptn())
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/validate", json=to_payload(project))
+    response = await client.post("/api/validate", json=to_payload(project))
 
     assert response.status_code == 200
     assert response.json() == {"valid": True, "errors": []}
 
 
-async def test_v2_input_basis_import_is_accepted_by_validate_api() -> None:
+async def test_v2_input_basis_import_is_accepted_by_validate_api(client: AsyncClient) -> None:
     """Projects imported from PTN v2 remain valid API payloads."""
     project = ptn_text_to_project(v2_ptn())
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/validate", json=to_payload(project))
+    response = await client.post("/api/validate", json=to_payload(project))
 
     assert response.status_code == 200
     assert response.json() == {"valid": True, "errors": []}
 
 
-async def test_v3_detector_tags_import_is_accepted_by_validate_api() -> None:
+async def test_v3_detector_tags_import_is_accepted_by_validate_api(client: AsyncClient) -> None:
     """Projects imported from PTN v3 remain valid API payloads."""
     project = ptn_text_to_project(v3_ptn())
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/validate", json=to_payload(project))
+    response = await client.post("/api/validate", json=to_payload(project))
 
     assert response.status_code == 200
     assert response.json() == {"valid": True, "errors": []}
 
 
-async def test_import_session_endpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_import_session_endpoint(client: AsyncClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Import session endpoint returns projects created by the CLI handoff store."""
     monkeypatch.setattr(import_sessions, "IMPORT_SESSION_DIR", tmp_path)
     project = ptn_text_to_project(simple_ptn())
     token = import_sessions.create_import_session(project)
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.get(f"/api/import-session/{token}")
+    response = await client.get(f"/api/import-session/{token}")
 
     assert response.status_code == 200
     assert response.json()["nodes"] == project["nodes"]
 
 
 async def test_create_import_session_endpoint_uses_backend_session_store(
+    client: AsyncClient,
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -208,29 +192,21 @@ async def test_create_import_session_endpoint_uses_backend_session_store(
     monkeypatch.setattr(import_sessions, "IMPORT_SESSION_DIR", tmp_path)
     project = ptn_text_to_project(simple_ptn())
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        create_response = await client.post("/api/import-session", json=project)
-        token = create_response.json()["token"]
-        read_response = await client.get(f"/api/import-session/{token}")
+    create_response = await client.post("/api/import-session", json=project)
+    token = create_response.json()["token"]
+    read_response = await client.get(f"/api/import-session/{token}")
 
     assert create_response.status_code == 200
     assert read_response.status_code == 200
     assert read_response.json()["nodes"] == project["nodes"]
 
 
-async def test_import_ptn_endpoint_converts_text() -> None:
+async def test_import_ptn_endpoint_converts_text(client: AsyncClient) -> None:
     """PTN text can be imported directly through the API."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/import-ptn",
-            json={"text": simple_ptn(), "name": "browser-import"},
-        )
+    response = await client.post(
+        "/api/import-ptn",
+        json={"text": simple_ptn(), "name": "browser-import"},
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -239,28 +215,20 @@ async def test_import_ptn_endpoint_converts_text() -> None:
     assert [node["id"] for node in data["nodes"]] == ["n0", "n1", "n2"]
 
 
-async def test_import_ptn_endpoint_rejects_invalid_ptn() -> None:
+async def test_import_ptn_endpoint_rejects_invalid_ptn(client: AsyncClient) -> None:
     """Invalid PTN text is reported as a bad request."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/import-ptn",
-            json={"text": "not a ptn", "name": "bad"},
-        )
+    response = await client.post(
+        "/api/import-ptn",
+        json={"text": "not a ptn", "name": "bad"},
+    )
 
     assert response.status_code == 400
     assert response.json()["detail"].startswith("Invalid PTN file:")
 
 
-async def test_import_session_endpoint_rejects_invalid_token() -> None:
+async def test_import_session_endpoint_rejects_invalid_token(client: AsyncClient) -> None:
     """Import session endpoint rejects non-UUID tokens."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.get("/api/import-session/not-a-token")
+    response = await client.get("/api/import-session/not-a-token")
 
     assert response.status_code == 400
 
@@ -4,9 +4,16 @@ from typing import Any
 
 import pytest
 from graphqomb.schedule_solver import ScheduleConfig
-from httpx import ASGITransport, AsyncClient
-from src.main import app
+from httpx import AsyncClient
 from src.routers import schedule as schedule_router
+from src.services.cache import GRAPH_CONTEXT_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_schedule_cache() -> None:
+    """Start every test without cached schedule results or converted graphs."""
+    schedule_router.SCHEDULE_CACHE.clear()
+    GRAPH_CONTEXT_CACHE.clear()
 
 
 def create_schedulable_project() -> dict[str, Any]:
@@ -42,13 +49,9 @@ def create_schedulable_project() -> dict[str, Any]:
     }
 
 
-async def test_schedule_valid_project() -> None:
+async def test_schedule_valid_project(client: AsyncClient) -> None:
     """Test scheduling a valid project."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/schedule", json=create_schedulable_project())
+    response = await client.post("/api/schedule", json=create_schedulable_project())
 
     assert response.status_code == 200
     data = response.json()
@@ -69,64 +72,52 @@ async def test_schedule_valid_project() -> None:
         assert "measureNodes" in first_slice
 
 
-async def test_schedule_with_strategy() -> None:
+async def test_schedule_with_strategy(client: AsyncClient) -> None:
     """Test scheduling with different strategies."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        # Test MINIMIZE_SPACE strategy
-        response = await client.post(
-            "/api/schedule?strategy=MINIMIZE_SPACE",
-            json=project,
-        )
-        assert response.status_code == 200
+    # Test MINIMIZE_SPACE strategy
+    response = await client.post(
+        "/api/schedule?strategy=MINIMIZE_SPACE",
+        json=project,
+    )
+    assert response.status_code == 200
 
-        # Test MINIMIZE_TIME strategy
-        response = await client.post(
-            "/api/schedule?strategy=MINIMIZE_TIME",
-            json=project,
-        )
-        assert response.status_code == 200
+    # Test MINIMIZE_TIME strategy
+    response = await client.post(
+        "/api/schedule?strategy=MINIMIZE_TIME",
+        json=project,
+    )
+    assert response.status_code == 200
 
 
-async def test_schedule_with_performance_controls() -> None:
+async def test_schedule_with_performance_controls(client: AsyncClient) -> None:
     """Test scheduling with greedy mode and resource limits."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/schedule?strategy=MINIMIZE_TIME&use_greedy=true&max_time=10&max_qubit_count=3",
-            json=project,
-        )
+    response = await client.post(
+        "/api/schedule?strategy=MINIMIZE_TIME&use_greedy=true&max_time=10&max_qubit_count=3",
+        json=project,
+    )
 
     assert response.status_code == 200
     data = response.json()
     assert "timeline" in data
 
 
-async def test_schedule_rejects_too_small_max_time() -> None:
+async def test_schedule_rejects_too_small_max_time(client: AsyncClient) -> None:
     """Test scheduling fails when max_time is too small."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/schedule?strategy=MINIMIZE_TIME&use_greedy=true&max_time=1",
-            json=project,
-        )
+    response = await client.post(
+        "/api/schedule?strategy=MINIMIZE_TIME&use_greedy=true&max_time=1",
+        json=project,
+    )
 
     assert response.status_code == 400
 
 
-async def test_schedule_passes_max_qubit_count_to_solver(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_schedule_passes_max_qubit_count_to_solver(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test max_qubit_count is passed through to graphqomb ScheduleConfig."""
     project = create_schedulable_project()
     captured_config: dict[str, ScheduleConfig] = {}
@@ -145,35 +136,91 @@ async def test_schedule_passes_max_qubit_count_to_solver(monkeypatch: pytest.Mon
 
     monkeypatch.setattr(schedule_router, "Scheduler", FakeScheduler)
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/schedule?strategy=MINIMIZE_SPACE&max_qubit_count=1",
-            json=project,
-        )
+    response = await client.post(
+        "/api/schedule?strategy=MINIMIZE_SPACE&max_qubit_count=1",
+        json=project,
+    )
 
     assert response.status_code == 200
     assert captured_config["config"].max_qubit_count == 1
 
 
-async def test_schedule_rejects_invalid_performance_limits() -> None:
+async def test_schedule_reuses_cached_result(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test identical schedule requests are solved only once."""
+    project = create_schedulable_project()
+    solve_calls: list[ScheduleConfig] = []
+
+    class FakeScheduler:
+        def __init__(self, _graph: Any, _xflow: Any, _zflow: Any) -> None:
+            self.prepare_time: dict[int, int | None] = {}
+            self.measure_time: dict[int, int | None] = {}
+            self.entangle_time: dict[tuple[int, int], int | None] = {}
+            self.timeline: list[Any] = []
+
+        def solve_schedule(self, config: ScheduleConfig, timeout: int) -> bool:
+            assert timeout == 60
+            solve_calls.append(config)
+            return True
+
+    monkeypatch.setattr(schedule_router, "Scheduler", FakeScheduler)
+
+    first = await client.post("/api/schedule", json=project)
+    second = await client.post("/api/schedule", json=project)
+    other_strategy = await client.post("/api/schedule?strategy=MINIMIZE_TIME", json=project)
+
+    assert first.status_code == 200
+    assert second.json() == first.json()
+    assert other_strategy.status_code == 200
+    assert len(solve_calls) == 2
+
+
+async def test_schedule_does_not_cache_timed_out_solves(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test CP-SAT results that hit the time limit are re-solved, while greedy results are cached."""
+    project = create_schedulable_project()
+    solve_calls: list[ScheduleConfig] = []
+
+    class FakeScheduler:
+        def __init__(self, _graph: Any, _xflow: Any, _zflow: Any) -> None:
+            self.prepare_time: dict[int, int | None] = {}
+            self.measure_time: dict[int, int | None] = {}
+            self.entangle_time: dict[tuple[int, int], int | None] = {}
+            self.timeline: list[Any] = []
+
+        def solve_schedule(self, config: ScheduleConfig, timeout: int) -> bool:
+            assert timeout == schedule_router.SOLVER_TIMEOUT
+            solve_calls.append(config)
+            return True
+
+        def num_slices(self) -> int:
+            return 0
+
+    monkeypatch.setattr(schedule_router, "Scheduler", FakeScheduler)
+    # Every solve now takes at least the whole time limit
+    monkeypatch.setattr(schedule_router, "SOLVER_TIMEOUT", 0)
+
+    for _ in range(2):
+        response = await client.post("/api/schedule", json=project)
+        assert response.status_code == 200
+    assert len(solve_calls) == 2
+
+    for _ in range(2):
+        response = await client.post("/api/schedule?use_greedy=true", json=project)
+        assert response.status_code == 200
+    assert len(solve_calls) == 3
+
+
+async def test_schedule_rejects_invalid_performance_limits(client: AsyncClient) -> None:
     """Test scheduling rejects non-positive performance limits."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/schedule?max_time=0", json=project)
-        assert response.status_code == 422
+    response = await client.post("/api/schedule?max_time=0", json=project)
+    assert response.status_code == 422
 
-        response = await client.post("/api/schedule?max_qubit_count=0", json=project)
-        assert response.status_code == 422
+    response = await client.post("/api/schedule?max_qubit_count=0", json=project)
+    assert response.status_code == 422
 
 
-async def test_schedule_empty_project() -> None:
+async def test_schedule_empty_project(client: AsyncClient) -> None:
     """Test scheduling an empty project."""
     project: dict[str, Any] = {
         "name": "Empty",
@@ -182,11 +229,7 @@ async def test_schedule_empty_project() -> None:
         "flow": {"xflow": {}, "zflow": "auto"},
     }
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/schedule", json=project)
+    response = await client.post("/api/schedule", json=project)
 
     # Empty project should still return a valid (empty) schedule
     assert response.status_code == 200
@@ -196,32 +239,24 @@ async def test_schedule_empty_project() -> None:
     assert data["entangleTime"] == {}
 
 
-async def test_schedule_invalid_strategy() -> None:
+async def test_schedule_invalid_strategy(client: AsyncClient) -> None:
     """Test scheduling with invalid strategy."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post(
-            "/api/schedule?strategy=INVALID",
-            json=project,
-        )
+    response = await client.post(
+        "/api/schedule?strategy=INVALID",
+        json=project,
+    )
 
     # Should fail with 422 (validation error)
     assert response.status_code == 422
 
 
-async def test_schedule_returns_node_ids() -> None:
+async def test_schedule_returns_node_ids(client: AsyncClient) -> None:
     """Test that schedule returns frontend node IDs, not internal indices."""
     project = create_schedulable_project()
 
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
-        response = await client.post("/api/schedule", json=project)
+    response = await client.post("/api/schedule", json=project)
 
     assert response.status_code == 200
     data = response.json()